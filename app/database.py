@@ -1,13 +1,17 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from sqlalchemy.orm import Session, raiseload
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.orm import declarative_base
 import os
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# When set, any lazy load raises instead of silently emitting an N+1
+# query; run tests with STRICT_LOADING=1 to catch missing eager loads
+STRICT_LOADING = os.getenv("STRICT_LOADING") == "1"
+
 # Database URL
 DATABASE_URL = os.getenv(
     "DATABASE_URL",
@@ -17,28 +21,38 @@ DATABASE_URL = os.getenv(
 # Create async engine
 engine = create_async_engine(
     DATABASE_URL,
-    echo=True,
-    future=True
+    echo=False,
+    future=True,
+    query_cache_size=1200,
+    pool_size=20,
+    max_overflow=20,
+    pool_pre_ping=True,
+    pool_recycle=1800
 )
 
 # Create async session factory
-AsyncSessionLocal = sessionmaker(
+AsyncSessionLocal = async_sessionmaker(
     engine,
-    class_=AsyncSession,
-    expire_on_commit=False
+    expire_on_commit=False,
+    autoflush=False
 )
 
 # Create base class for models
 Base = declarative_base()
 
-# Dependency to get DB session
+if STRICT_LOADING:
+    @event.listens_for(Session, "do_orm_execute")
+    def _forbid_lazy_loads(execute_state):
+        """Inject raiseload('*') so unintended lazy loads fail loudly"""
+        if execute_state.is_select and not execute_state.is_relationship_load:
+            execute_state.statement = execute_state.statement.options(raiseload('*'))
+
+# Dependency to get DB session; handlers commit explicitly when they
+# write, so read-only requests skip the commit round-trip
 async def get_db():
     async with AsyncSessionLocal() as session:
         try:
             yield session
-            await session.commit()
         except Exception:
             await session.rollback()
-            raise
-        finally:
-            await session.close() 
\ No newline at end of file
+            raise 
\ No newline at end of file
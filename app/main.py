@@ -1,93 +1,136 @@
 from fastapi import FastAPI, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, func, desc
 from typing import List
 from datetime import datetime, timedelta
-from .database import get_db
-from .models import Article, Topic, Source, ScrapingLog
-from .services.scraping_service import ScrapingService
+from async_lru import alru_cache
+from .database import get_db, AsyncSessionLocal
+from .models import Article, Topic, Source, ScrapingLog, article_topics
+from .schemas import ArticleOut, TrendingTopicOut, SourceOut, ScrapingLogOut
 import asyncio
 
-app = FastAPI(title="Nigerian Financial News Scraper")
+app = FastAPI(
+    title="Nigerian Financial News Scraper",
+    default_response_class=ORJSONResponse
+)
+
+# Dashboards poll these endpoints far more often than the data changes
+# (scrape cadence is 30 min); cache results briefly and drop them when
+# a scrape run lands new articles
+RESPONSE_CACHE_TTL = 60
+
+# List endpoints never need the (compressed) content blob; project only
+# the columns the dashboard renders
+ARTICLE_LIST_COLUMNS = (
+    Article.id,
+    Article.title,
+    Article.url,
+    Article.source,
+    Article.category,
+    Article.author,
+    Article.published_at,
+    Article.word_count,
+    Article.reading_time,
+)
 
 @app.on_event("startup")
 async def startup_event():
     """Start the scraping scheduler on startup"""
     asyncio.create_task(start_scraping_scheduler())
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release the shared HTTP client session"""
+    from .scrapers.base import close_session
+    await close_session()
+
 async def start_scraping_scheduler():
     """Start the scraping scheduler"""
     from .services.scraping_service import schedule_scraping
-    schedule_scraping()
+    await schedule_scraping()
 
 @app.get("/")
 async def root():
     return {"message": "Nigerian Financial News Scraper API"}
 
-@app.get("/articles/latest")
+@alru_cache(maxsize=256, ttl=RESPONSE_CACHE_TTL)
+async def _fetch_latest_articles(limit: int, skip: int, category: str, source: str):
+    async with AsyncSessionLocal() as db:
+        query = select(*ARTICLE_LIST_COLUMNS).order_by(Article.published_at.desc())
+
+        if category:
+            query = query.filter(Article.category == category)
+        if source:
+            query = query.filter(Article.source == source)
+
+        query = query.offset(skip).limit(limit)
+
+        result = await db.execute(query)
+        return [dict(row) for row in result.mappings()]
+
+@alru_cache(maxsize=256, ttl=RESPONSE_CACHE_TTL)
+async def _fetch_trending_articles(hours: int, limit: int):
+    since = datetime.utcnow() - timedelta(hours=hours)
+
+    async with AsyncSessionLocal() as db:
+        query = select(*ARTICLE_LIST_COLUMNS).filter(
+            Article.published_at >= since
+        ).order_by(Article.published_at.desc()).limit(limit)
+
+        result = await db.execute(query)
+        return [dict(row) for row in result.mappings()]
+
+@alru_cache(maxsize=256, ttl=RESPONSE_CACHE_TTL)
+async def _fetch_trending_topics(hours: int, limit: int):
+    since = datetime.utcnow() - timedelta(hours=hours)
+
+    async with AsyncSessionLocal() as db:
+        query = select(
+            Topic, func.count(Article.id).label('article_count')
+        ).join(
+            article_topics, Topic.id == article_topics.c.topic_id
+        ).join(
+            Article, Article.id == article_topics.c.article_id
+        ).filter(
+            Article.published_at >= since
+        ).group_by(Topic.id).order_by(
+            desc('article_count')
+        ).limit(limit)
+
+        result = await db.execute(query)
+        return [
+            {"id": topic.id, "name": topic.name, "article_count": count}
+            for topic, count in result.all()
+        ]
+
+def clear_response_caches():
+    """Drop cached list responses (called after each scrape run)"""
+    _fetch_latest_articles.cache_clear()
+    _fetch_trending_articles.cache_clear()
+    _fetch_trending_topics.cache_clear()
+
+@app.get("/articles/latest", response_model=List[ArticleOut])
 async def get_latest_articles(
     limit: int = 10,
     skip: int = 0,
     category: str = None,
-    source: str = None,
-    db: AsyncSession = Depends(get_db)
+    source: str = None
 ):
     """Get latest articles with optional filtering"""
-    query = select(Article).order_by(Article.published_at.desc())
-    
-    if category:
-        query = query.filter(Article.category == category)
-    if source:
-        query = query.filter(Article.source == source)
-        
-    query = query.offset(skip).limit(limit)
-    
-    result = await db.execute(query)
-    articles = result.scalars().all()
-    
-    return articles
+    return await _fetch_latest_articles(limit, skip, category, source)
 
-@app.get("/articles/trending")
-async def get_trending_articles(
-    hours: int = 24,
-    limit: int = 10,
-    db: AsyncSession = Depends(get_db)
-):
+@app.get("/articles/trending", response_model=List[ArticleOut])
+async def get_trending_articles(hours: int = 24, limit: int = 10):
     """Get trending articles based on recent activity"""
-    since = datetime.utcnow() - timedelta(hours=hours)
-    
-    query = select(Article).filter(
-        Article.published_at >= since
-    ).order_by(Article.published_at.desc()).limit(limit)
-    
-    result = await db.execute(query)
-    articles = result.scalars().all()
-    
-    return articles
+    return await _fetch_trending_articles(hours, limit)
 
-@app.get("/topics/trending")
-async def get_trending_topics(
-    hours: int = 24,
-    limit: int = 10,
-    db: AsyncSession = Depends(get_db)
-):
+@app.get("/topics/trending", response_model=List[TrendingTopicOut])
+async def get_trending_topics(hours: int = 24, limit: int = 10):
     """Get trending topics based on recent articles"""
-    since = datetime.utcnow() - timedelta(hours=hours)
-    
-    query = select(Topic).join(
-        Topic.articles
-    ).filter(
-        Article.published_at >= since
-    ).group_by(Topic.id).order_by(
-        Topic.articles.count().desc()
-    ).limit(limit)
-    
-    result = await db.execute(query)
-    topics = result.scalars().all()
-    
-    return topics
+    return await _fetch_trending_topics(hours, limit)
 
-@app.get("/sources/status")
+@app.get("/sources/status", response_model=List[SourceOut])
 async def get_sources_status(db: AsyncSession = Depends(get_db)):
     """Get status of all news sources"""
     query = select(Source)
@@ -96,7 +139,7 @@ async def get_sources_status(db: AsyncSession = Depends(get_db)):
     
     return sources
 
-@app.get("/scraping/logs")
+@app.get("/scraping/logs", response_model=List[ScrapingLogOut])
 async def get_scraping_logs(
     limit: int = 10,
     source: str = None,
@@ -118,9 +161,9 @@ async def get_scraping_logs(
 @app.post("/scraping/run")
 async def trigger_scraping():
     """Manually trigger a scraping run"""
+    from .services.scraping_service import run_scraping_job
     try:
-        service = ScrapingService()
-        await service.run_scraping()
+        await run_scraping_job()
         return {"message": "Scraping completed successfully"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
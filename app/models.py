@@ -1,22 +1,45 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, Float, ForeignKey, Table
+from sqlalchemy import Column, Integer, String, LargeBinary, DateTime, Float, Boolean, ForeignKey, Table, Index, Text, PrimaryKeyConstraint
+from sqlalchemy.dialects.mysql import MEDIUMBLOB
 from sqlalchemy.orm import relationship
 from datetime import datetime
+import zstandard
 from .database import Base
 
-# Association table for article topics
+_zstd_compressor = zstandard.ZstdCompressor(level=3)
+_zstd_decompressor = zstandard.ZstdDecompressor()
+
+def compress_content(text: str) -> bytes:
+    """Compress article text for storage in Article.content"""
+    return _zstd_compressor.compress(text.encode('utf-8'))
+
+def decompress_content(blob: bytes) -> str:
+    """Decompress an Article.content blob back to text"""
+    return _zstd_decompressor.decompress(blob).decode('utf-8')
+
+# Association table for article topics; the composite primary key is
+# what lets the INSERT IGNORE in save_articles deduplicate pairs
 article_topics = Table(
     'article_topics',
     Base.metadata,
     Column('article_id', Integer, ForeignKey('articles.id')),
-    Column('topic_id', Integer, ForeignKey('topics.id'))
+    Column('topic_id', Integer, ForeignKey('topics.id')),
+    PrimaryKeyConstraint('article_id', 'topic_id')
 )
 
 class Article(Base):
     __tablename__ = "articles"
 
-    id = Column(Integer, primary_key=True, index=True)
+    # Composite indexes covering the latest/trending list predicates
+    # (published_at range + optional category/source filter)
+    __table_args__ = (
+        Index('ix_articles_pub_cat', 'published_at', 'category'),
+        Index('ix_articles_pub_src', 'published_at', 'source'),
+    )
+
+    id = Column(Integer, primary_key=True)
     title = Column(String(255), nullable=False)
-    content = Column(Text, nullable=False)
+    # zstd-compressed text; see compress_content/decompress_content
+    content = Column(LargeBinary().with_variant(MEDIUMBLOB, 'mysql'), nullable=False)
     url = Column(String(255), unique=True, nullable=False)
     source = Column(String(50), nullable=False)
     published_at = Column(DateTime, nullable=False)
@@ -48,7 +71,7 @@ class Source(Base):
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(50), unique=True, nullable=False)
     base_url = Column(String(255), nullable=False)
-    is_active = Column(Integer, default=1)
+    is_active = Column(Boolean, default=True)
     last_scraped_at = Column(DateTime)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -0,0 +1,44 @@
+from datetime import datetime
+from typing import Optional
+from pydantic import BaseModel, ConfigDict
+
+class ArticleOut(BaseModel):
+    """Article fields returned by the list endpoints (no content blob)"""
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    title: str
+    url: str
+    source: str
+    category: Optional[str] = None
+    author: Optional[str] = None
+    published_at: datetime
+    word_count: Optional[int] = None
+    reading_time: Optional[int] = None
+
+class TrendingTopicOut(BaseModel):
+    """Topic with its article count over the requested window"""
+    id: int
+    name: str
+    article_count: int
+
+class SourceOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    name: str
+    base_url: str
+    is_active: bool
+    last_scraped_at: Optional[datetime] = None
+
+class ScrapingLogOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    source_id: Optional[int] = None
+    status: str
+    articles_found: int = 0
+    articles_scraped: int = 0
+    error_message: Optional[str] = None
+    started_at: datetime
+    completed_at: Optional[datetime] = None
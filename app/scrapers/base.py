@@ -1,36 +1,72 @@
 from abc import ABC, abstractmethod
 import aiohttp
 import asyncio
-from bs4 import BeautifulSoup
 from datetime import datetime
 import logging
 from typing import Dict, List, Optional
+from sqlalchemy import select
+from sqlalchemy.dialects.mysql import insert as mysql_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from ..models import Article, Source, ScrapingLog, Topic
+from ..models import Article, Source, ScrapingLog, Topic, article_topics, compress_content
 from ..database import AsyncSessionLocal
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+}
+
+# Sources and topics are small, effectively append-only tables hit on
+# every scrape step; cache name -> id for the process lifetime
+_source_id_cache: Dict[str, int] = {}
+_topic_id_cache: Dict[str, int] = {}
+
+# Shared for the process lifetime so keep-alive connections and the DNS
+# cache survive across scrape runs
+_session: Optional[aiohttp.ClientSession] = None
+
+async def get_session() -> aiohttp.ClientSession:
+    """Get the shared HTTP client session, creating it on first use"""
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            headers=HEADERS,
+            connector=aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=5,
+                keepalive_timeout=60,
+                ttl_dns_cache=300,
+                enable_cleanup_closed=True
+            ),
+            timeout=aiohttp.ClientTimeout(total=20)
+        )
+    return _session
+
+async def close_session():
+    """Close the shared HTTP client session (call on application shutdown)"""
+    global _session
+    if _session and not _session.closed:
+        await _session.close()
+    _session = None
+
 class BaseScraper(ABC):
     def __init__(self, source_name: str, base_url: str):
         self.source_name = source_name
         self.base_url = base_url
-        self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-        }
         self.session = None
         self.rate_limit = asyncio.Semaphore(5)  # Max 5 concurrent requests
 
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession(headers=self.headers)
+        self.session = await get_session()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
-            await self.session.close()
+        # The session is shared across scrapers and runs; it is closed
+        # once at application shutdown via close_session()
+        self.session = None
 
     @abstractmethod
     async def get_article_urls(self, category: str) -> List[str]:
@@ -57,61 +93,106 @@ class BaseScraper(ABC):
 
     async def scrape_category(self, category: str) -> List[Dict]:
         """Scrape all articles in a category"""
-        articles = []
         urls = await self.get_article_urls(category)
-        
-        for url in urls:
-            try:
-                article_data = await self.parse_article(url)
-                if article_data:
-                    articles.append(article_data)
-            except Exception as e:
-                logger.error(f"Error scraping article {url}: {str(e)}")
-                continue
-                
+        return await self.scrape_urls(urls)
+
+    async def scrape_urls(self, urls: List[str]) -> List[Dict]:
+        """Scrape articles concurrently, throttled by the rate-limit semaphore"""
+        results = await asyncio.gather(
+            *[self.parse_article(url) for url in urls],
+            return_exceptions=True
+        )
+
+        articles = []
+        for url, result in zip(urls, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error scraping article {url}: {str(result)}")
+            elif result:
+                articles.append(result)
+
         return articles
 
     async def save_articles(self, articles: List[Dict], session: AsyncSession):
-        """Save scraped articles to database"""
-        for article_data in articles:
-            try:
-                # Check if article already exists
-                existing = await session.execute(
-                    "SELECT id FROM articles WHERE url = :url",
-                    {"url": article_data['url']}
-                )
-                if existing.scalar_one_or_none():
+        """Save scraped articles to database in a fixed number of round-trips"""
+        if not articles:
+            return
+
+        try:
+            # Drop duplicates within the batch and anything already stored
+            urls = [article_data['url'] for article_data in articles]
+            existing_urls = set(
+                (await session.execute(
+                    select(Article.url).where(Article.url.in_(urls))
+                )).scalars()
+            )
+            new_data = []
+            for article_data in articles:
+                if article_data['url'] in existing_urls:
                     continue
+                existing_urls.add(article_data['url'])
+                new_data.append(article_data)
 
-                # Create new article
-                article = Article(**article_data)
-                session.add(article)
-                
-                # Handle topics
-                if 'topics' in article_data:
-                    for topic_name in article_data['topics']:
-                        topic = await session.execute(
-                            "SELECT id FROM topics WHERE name = :name",
-                            {"name": topic_name}
-                        )
-                        topic_id = topic.scalar_one_or_none()
-                        
-                        if not topic_id:
-                            new_topic = Topic(name=topic_name)
-                            session.add(new_topic)
-                            await session.flush()
-                            topic_id = new_topic.id
-                            
-                        await session.execute(
-                            "INSERT INTO article_topics (article_id, topic_id) VALUES (:article_id, :topic_id)",
-                            {"article_id": article.id, "topic_id": topic_id}
-                        )
+            if not new_data:
+                return
 
-            except Exception as e:
-                logger.error(f"Error saving article {article_data.get('url')}: {str(e)}")
-                continue
+            # Resolve topics from the process-level cache first, then one
+            # query for the rest, creating missing ones in bulk
+            topic_names = {t for a in new_data for t in a.get('topics', [])}
+            topic_map = {
+                name: _topic_id_cache[name]
+                for name in topic_names if name in _topic_id_cache
+            }
+            unknown_names = topic_names - topic_map.keys()
+            if unknown_names:
+                result = await session.execute(
+                    select(Topic).where(Topic.name.in_(unknown_names))
+                )
+                topic_map.update({topic.name: topic.id for topic in result.scalars()})
+                new_topics = [Topic(name=n) for n in unknown_names - topic_map.keys()]
+                if new_topics:
+                    session.add_all(new_topics)
+                    await session.flush()
+                    topic_map.update({topic.name: topic.id for topic in new_topics})
 
-        await session.commit()
+            # Bulk executemany insert; IGNORE covers races on the unique url
+            new_article_rows = [
+                {k: v for k, v in a.items() if k != 'topics'}
+                for a in new_data
+            ]
+            for row in new_article_rows:
+                row['content'] = compress_content(row['content'])
+            await session.execute(
+                mysql_insert(Article).prefix_with('IGNORE').values(new_article_rows)
+            )
+
+            # Map urls back to generated ids for the association rows
+            result = await session.execute(
+                select(Article.id, Article.url).where(
+                    Article.url.in_([row['url'] for row in new_article_rows])
+                )
+            )
+            url_to_id = {url: article_id for article_id, url in result.all()}
+
+            # Single bulk insert for the association rows
+            association_rows = [
+                {"article_id": url_to_id[article_data['url']], "topic_id": topic_map[name]}
+                for article_data in new_data
+                if article_data['url'] in url_to_id
+                for name in article_data.get('topics', [])
+            ]
+            if association_rows:
+                await session.execute(
+                    mysql_insert(article_topics).prefix_with("IGNORE").values(association_rows)
+                )
+
+            await session.commit()
+
+            # Only cache ids once the transaction is committed
+            _topic_id_cache.update(topic_map)
+
+        except Exception as e:
+            logger.error(f"Error saving articles: {str(e)}")
+            await session.rollback()
 
     async def log_scraping(self, status: str, articles_found: int, articles_scraped: int, 
                           error_message: Optional[str] = None, session: AsyncSession = None):
@@ -125,20 +206,35 @@ class BaseScraper(ABC):
         except Exception as e:
             logger.error(f"Error logging scraping activity: {str(e)}")
 
-    async def _create_log(self, session: AsyncSession, status: str, articles_found: int, 
+    async def _get_source_id(self, session: AsyncSession) -> int:
+        """Get this scraper's source id, creating the row if needed
+
+        Only ids of already-committed rows are cached here; a freshly
+        flushed row is cached by the caller once its transaction commits,
+        so a rollback cannot poison the cache.
+        """
+        source_id = _source_id_cache.get(self.source_name)
+        if source_id is not None:
+            return source_id
+
+        result = await session.execute(
+            select(Source.id).where(Source.name == self.source_name)
+        )
+        source_id = result.scalar_one_or_none()
+
+        if source_id:
+            _source_id_cache[self.source_name] = source_id
+            return source_id
+
+        source = Source(name=self.source_name, base_url=self.base_url)
+        session.add(source)
+        await session.flush()
+        return source.id
+
+    async def _create_log(self, session: AsyncSession, status: str, articles_found: int,
                          articles_scraped: int, error_message: Optional[str]):
         """Create scraping log entry"""
-        source = await session.execute(
-            "SELECT id FROM sources WHERE name = :name",
-            {"name": self.source_name}
-        )
-        source_id = source.scalar_one_or_none()
-        
-        if not source_id:
-            source = Source(name=self.source_name, base_url=self.base_url)
-            session.add(source)
-            await session.flush()
-            source_id = source.id
+        source_id = await self._get_source_id(session)
 
         log = ScrapingLog(
             source_id=source_id,
@@ -149,4 +245,7 @@ class BaseScraper(ABC):
             started_at=datetime.utcnow()
         )
         session.add(log)
-        await session.commit() 
\ No newline at end of file
+        await session.commit()
+
+        # Only cache the id once the transaction is committed
+        _source_id_cache[self.source_name] = source_id 
\ No newline at end of file
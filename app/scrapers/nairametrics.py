@@ -1,4 +1,8 @@
-from bs4 import BeautifulSoup
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
+import ciso8601
+from selectolax.parser import HTMLParser
 from datetime import datetime
 import re
 from typing import Dict, List, Optional
@@ -7,10 +11,136 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+SOURCE_NAME = "Nairametrics"
+
+# Selector strings bound to module-level names once; selectolax has no
+# precompiled selector objects, so this removes the per-call dict lookup
+SEL_ARTICLE_LIST = 'div.post-listing article.post'
+SEL_TITLE = 'h2.entry-title a'
+SEL_CONTENT = 'div.entry-content p'
+SEL_DATE = 'time.entry-date'
+SEL_AUTHOR = 'span.author-name'
+SEL_CATEGORY = 'span.category-name'
+
+# HTML -> dict parsing is pure CPU; a process pool lets it scale across
+# cores instead of contending for the GIL under the event loop
+_PARSE_POOL = ProcessPoolExecutor(max_workers=os.cpu_count())
+
+# Keyword -> topic lookup for topic extraction
+KEYWORD_TO_TOPIC = {
+    'bank': 'banking',
+    'banking': 'banking',
+    'cbn': 'banking',
+    'central bank': 'banking',
+    'economy': 'economy',
+    'economic': 'economy',
+    'gdp': 'economy',
+    'inflation': 'economy',
+    'market': 'markets',
+    'stock': 'markets',
+    'nse': 'markets',
+    'trading': 'markets',
+    'tech': 'technology',
+    'digital': 'technology',
+    'fintech': 'technology',
+    'blockchain': 'technology',
+    'business': 'business',
+    'company': 'business',
+    'corporate': 'business',
+    'enterprise': 'business',
+}
+
+# Single alternation compiled once; longest keywords first so
+# 'central bank' wins over 'bank'
+_TOPIC_RE = re.compile(
+    r'\b(?:'
+    + '|'.join(sorted(map(re.escape, KEYWORD_TO_TOPIC), key=len, reverse=True))
+    + r')\b',
+    re.IGNORECASE
+)
+
+def _parse_article_html(html: str, url: str) -> Optional[Dict]:
+    """Extract article fields from raw HTML (synchronous, CPU-bound)
+
+    Module-level so it can be pickled into the parse process pool.
+    """
+    try:
+        tree = HTMLParser(html)
+
+        # Extract title
+        title_node = tree.css_first(SEL_TITLE)
+        if not title_node:
+            return None
+        title = title_node.text(strip=True)
+
+        # Extract content
+        content = ' '.join(
+            p.text(strip=True) for p in tree.css(SEL_CONTENT)
+        )
+
+        # Extract date
+        date_node = tree.css_first(SEL_DATE)
+        published_at = datetime.utcnow()
+        if date_node and date_node.attributes.get('datetime'):
+            try:
+                # ciso8601 parses the fixed ISO-8601 layout in C and
+                # handles the trailing 'Z' without a string copy
+                published_at = ciso8601.parse_datetime(date_node.attributes['datetime'])
+            except ValueError:
+                logger.warning(f"Could not parse date for {url}")
+
+        # Extract author
+        author_node = tree.css_first(SEL_AUTHOR)
+        author = author_node.text(strip=True) if author_node else None
+
+        # Extract category
+        category_node = tree.css_first(SEL_CATEGORY)
+        category = category_node.text(strip=True) if category_node else None
+
+        # Calculate word count and reading time
+        word_count = len(content.split())
+        reading_time = max(1, word_count // 200)  # Assuming 200 words per minute
+
+        # Extract topics (using category and content analysis)
+        topics = _extract_topics(content, category)
+
+        return {
+            'title': title,
+            'content': content,
+            'url': url,
+            'source': SOURCE_NAME,
+            'published_at': published_at,
+            'author': author,
+            'category': category,
+            'word_count': word_count,
+            'reading_time': reading_time,
+            'topics': topics
+        }
+
+    except Exception as e:
+        logger.error(f"Error parsing article {url}: {str(e)}")
+        return None
+
+def _extract_topics(content: str, category: Optional[str]) -> List[str]:
+    """Extract topics from content and category"""
+    topics = set()
+
+    # Add category as a topic
+    if category:
+        topics.add(category.lower())
+
+    # One linear scan of the content for all keywords at once
+    topics.update(
+        KEYWORD_TO_TOPIC[match.group(0).lower()]
+        for match in _TOPIC_RE.finditer(content)
+    )
+
+    return list(topics)
+
 class NairametricsScraper(BaseScraper):
     def __init__(self):
         super().__init__(
-            source_name="Nairametrics",
+            source_name=SOURCE_NAME,
             base_url="https://nairametrics.com"
         )
         self.categories = [
@@ -20,14 +150,6 @@ class NairametricsScraper(BaseScraper):
             'technology',
             'business'
         ]
-        self.selectors = {
-            'article_list': 'div.post-listing article.post',
-            'title': 'h2.entry-title a',
-            'content': 'div.entry-content p',
-            'date': 'time.entry-date',
-            'author': 'span.author-name',
-            'category': 'span.category-name'
-        }
 
     async def get_article_urls(self, category: str) -> List[str]:
         """Get list of article URLs for a given category"""
@@ -39,13 +161,13 @@ class NairametricsScraper(BaseScraper):
             if not html:
                 return urls
 
-            soup = BeautifulSoup(html, 'lxml')
-            articles = soup.select(self.selectors['article_list'])
-            
+            tree = HTMLParser(html)
+            articles = tree.css(SEL_ARTICLE_LIST)
+
             for article in articles:
-                link = article.select_one(self.selectors['title'])
-                if link and 'href' in link.attrs:
-                    urls.append(link['href'])
+                link = article.css_first(SEL_TITLE)
+                if link and link.attributes.get('href'):
+                    urls.append(link.attributes['href'])
 
         except Exception as e:
             logger.error(f"Error getting article URLs for {category}: {str(e)}")
@@ -54,85 +176,11 @@ class NairametricsScraper(BaseScraper):
 
     async def parse_article(self, url: str) -> Optional[Dict]:
         """Parse a single article page"""
-        try:
-            html = await self.fetch_page(url)
-            if not html:
-                return None
-
-            soup = BeautifulSoup(html, 'lxml')
-            
-            # Extract title
-            title_elem = soup.select_one(self.selectors['title'])
-            if not title_elem:
-                return None
-            title = title_elem.get_text(strip=True)
-
-            # Extract content
-            content_elems = soup.select(self.selectors['content'])
-            content = ' '.join([p.get_text(strip=True) for p in content_elems])
-            
-            # Extract date
-            date_elem = soup.select_one(self.selectors['date'])
-            published_at = datetime.utcnow()
-            if date_elem and 'datetime' in date_elem.attrs:
-                try:
-                    published_at = datetime.fromisoformat(date_elem['datetime'].replace('Z', '+00:00'))
-                except ValueError:
-                    logger.warning(f"Could not parse date for {url}")
-
-            # Extract author
-            author_elem = soup.select_one(self.selectors['author'])
-            author = author_elem.get_text(strip=True) if author_elem else None
-
-            # Extract category
-            category_elem = soup.select_one(self.selectors['category'])
-            category = category_elem.get_text(strip=True) if category_elem else None
-
-            # Calculate word count and reading time
-            word_count = len(content.split())
-            reading_time = max(1, word_count // 200)  # Assuming 200 words per minute
-
-            # Extract topics (using category and content analysis)
-            topics = self._extract_topics(content, category)
-
-            return {
-                'title': title,
-                'content': content,
-                'url': url,
-                'source': self.source_name,
-                'published_at': published_at,
-                'author': author,
-                'category': category,
-                'word_count': word_count,
-                'reading_time': reading_time,
-                'topics': topics
-            }
-
-        except Exception as e:
-            logger.error(f"Error parsing article {url}: {str(e)}")
+        html = await self.fetch_page(url)
+        if not html:
             return None
 
-    def _extract_topics(self, content: str, category: Optional[str]) -> List[str]:
-        """Extract topics from content and category"""
-        topics = set()
-        
-        # Add category as a topic
-        if category:
-            topics.add(category.lower())
-
-        # Common financial topics to look for
-        financial_topics = {
-            'banking': ['bank', 'banking', 'cbn', 'central bank'],
-            'economy': ['economy', 'economic', 'gdp', 'inflation'],
-            'markets': ['market', 'stock', 'nse', 'trading'],
-            'technology': ['tech', 'digital', 'fintech', 'blockchain'],
-            'business': ['business', 'company', 'corporate', 'enterprise']
-        }
-
-        # Check content for topic keywords
-        content_lower = content.lower()
-        for topic, keywords in financial_topics.items():
-            if any(keyword in content_lower for keyword in keywords):
-                topics.add(topic)
-
-        return list(topics) 
\ No newline at end of file
+        # Parsing is pure CPU; run it in the process pool so throughput
+        # scales with cores and the event loop stays free for fetches
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_PARSE_POOL, _parse_article_html, html, url) 
\ No newline at end of file
@@ -2,6 +2,7 @@ import asyncio
 import logging
 from datetime import datetime
 from typing import List, Optional
+from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
 from ..database import AsyncSessionLocal
 from ..scrapers.nairametrics import NairametricsScraper
@@ -9,6 +10,10 @@ from ..models import Source
 
 logger = logging.getLogger(__name__)
 
+# Articles are flushed to the database in batches of this size while
+# fetching/parsing continues in the background
+SAVE_BATCH_SIZE = 50
+
 class ScrapingService:
     def __init__(self):
         self.scrapers = [
@@ -40,24 +45,57 @@ class ScrapingService:
 
         try:
             async with scraper as scraper_instance:
-                for category in scraper.categories:
+                # Producers fetch and parse, the consumer batches inserts;
+                # network, parse and DB phases overlap instead of running
+                # back to back. The bounded queue applies backpressure if
+                # the database falls behind.
+                queue = asyncio.Queue(maxsize=200)
+                done = object()
+
+                async def produce_article(url):
                     try:
-                        # Get article URLs
-                        urls = await scraper_instance.get_article_urls(category)
-                        total_articles_found += len(urls)
-
-                        # Scrape articles
-                        articles = await scraper_instance.scrape_category(category)
-                        total_articles_scraped += len(articles)
-
-                        # Save articles
-                        if articles:
-                            await scraper_instance.save_articles(articles, session)
-
+                        article = await scraper_instance.parse_article(url)
                     except Exception as e:
-                        logger.error(f"Error scraping category {category}: {str(e)}")
-                        error_message = str(e)
-                        continue
+                        logger.error(f"Error scraping article {url}: {str(e)}")
+                        return
+                    if article:
+                        await queue.put(article)
+
+                async def produce_category(category):
+                    nonlocal total_articles_found
+                    urls = await scraper_instance.get_article_urls(category)
+                    total_articles_found += len(urls)
+                    await asyncio.gather(*[produce_article(u) for u in urls])
+
+                async def produce_all():
+                    nonlocal error_message
+                    results = await asyncio.gather(
+                        *[produce_category(c) for c in scraper.categories],
+                        return_exceptions=True
+                    )
+                    for category, result in zip(scraper.categories, results):
+                        if isinstance(result, Exception):
+                            logger.error(f"Error scraping category {category}: {str(result)}")
+                            error_message = str(result)
+                    await queue.put(done)
+
+                async def consume():
+                    nonlocal total_articles_scraped
+                    batch = []
+                    while True:
+                        article = await queue.get()
+                        if article is done:
+                            break
+                        batch.append(article)
+                        if len(batch) >= SAVE_BATCH_SIZE:
+                            await scraper_instance.save_articles(batch, session)
+                            total_articles_scraped += len(batch)
+                            batch = []
+                    if batch:
+                        await scraper_instance.save_articles(batch, session)
+                        total_articles_scraped += len(batch)
+
+                await asyncio.gather(produce_all(), consume())
 
                 # Update source last scraped time
                 await self._update_source_last_scraped(scraper.source_name, session)
@@ -80,37 +118,34 @@ class ScrapingService:
         """Update the last scraped timestamp for a source"""
         try:
             await session.execute(
-                "UPDATE sources SET last_scraped_at = :now WHERE name = :name",
-                {"now": datetime.utcnow(), "name": source_name}
+                update(Source)
+                .where(Source.name == source_name)
+                .values(last_scraped_at=datetime.utcnow())
             )
             await session.commit()
         except Exception as e:
             logger.error(f"Error updating last scraped time for {source_name}: {str(e)}")
 
+# Scrape every 30 minutes
+SCRAPE_INTERVAL_SECONDS = 1800
+
 async def run_scraping_job():
     """Run the scraping job"""
     service = ScrapingService()
     await service.run_scraping()
 
-def schedule_scraping():
-    """Schedule regular scraping jobs"""
-    import schedule
-    import time
-    import asyncio
-
-    def run_job():
-        asyncio.run(run_scraping_job())
-
-    # Schedule scraping every 30 minutes
-    schedule.every(30).minutes.do(run_job)
+    # New articles just landed; drop the cached list responses
+    from ..main import clear_response_caches
+    clear_response_caches()
 
-    # Run immediately on startup
-    run_job()
-
-    # Keep the scheduler running
+async def schedule_scraping():
+    """Run scraping on a fixed interval without blocking the event loop"""
     while True:
-        schedule.run_pending()
-        time.sleep(60)
+        try:
+            await run_scraping_job()
+        except Exception:
+            logger.exception("Scheduled scraping run failed")
+        await asyncio.sleep(SCRAPE_INTERVAL_SECONDS)
 
 if __name__ == "__main__":
-    schedule_scraping() 
\ No newline at end of file
+    asyncio.run(schedule_scraping()) 
\ No newline at end of file